@@ -1,8 +1,14 @@
+import argparse
 import datetime
 import pandas as pd
 from bs4 import BeautifulSoup
 from feedly import refresh_access_token, get_feedly_articles
-from rank_openai import batch_gpt_scoring, generate_bullet_points_for_top_articles, DEFAULT_BATCH_SIZE
+from rank_openai import (
+    batch_gpt_scoring,
+    generate_bullet_points_for_top_articles,
+    score_and_summarize_articles,
+    DEFAULT_BATCH_SIZE
+)
 from typing import List, Dict, Any, Callable, Optional
 import os
 from dotenv import load_dotenv
@@ -74,7 +80,8 @@ def extract_article_data(article):
 
 def fetch_and_process_articles(
     days_to_fetch: int = 7,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    realtime: bool = True
 ) -> pd.DataFrame:
     """
     Fetch articles from Feedly and process them with GPT ranking.
@@ -82,6 +89,7 @@ def fetch_and_process_articles(
     Args:
         days_to_fetch (int): Number of days to fetch articles for
         progress_callback (Optional[Callable[[str], None]]): Callback function to report progress
+        realtime (bool): Score articles with realtime API calls instead of the Batch API
         
     Returns:
         pd.DataFrame: Processed articles with GPT rankings
@@ -120,13 +128,21 @@ def fetch_and_process_articles(
         df['Summary'] = df['Summary'].apply(clean_html_content)
         df['Content'] = df['Content'].apply(clean_html_content)
         
-        # First phase: Score all articles
-        log_progress("🤖 Starting article scoring...")
-        df = batch_gpt_scoring(df, column='Summary')
+        if realtime:
+            # Score all articles and generate bullet points for the top 5 as they are found
+            log_progress("🤖 Scoring articles and generating bullet points for top articles...")
+            df = score_and_summarize_articles(df, column='Summary', content_column='Content', top_n=5)
+        else:
+            # First phase: Score all articles
+            log_progress("🤖 Starting article scoring...")
+            df = batch_gpt_scoring(df, column='Summary', realtime=False)
+            
+            # Second phase: Generate bullet points for top 5 articles
+            log_progress("📝 Generating bullet points for top articles...")
+            df = generate_bullet_points_for_top_articles(df, column='Content', top_n=5)
         
-        # Second phase: Generate bullet points for top 5 articles
-        log_progress("📝 Generating bullet points for top articles...")
-        df = generate_bullet_points_for_top_articles(df, column='Content', top_n=5)
+        # Rank articles for display; a stable sort keeps the same tie order as the top articles above
+        df = df.sort_values('GPT_Pertinence', ascending=False, kind='stable')
         
         return df
         
@@ -135,7 +151,12 @@ def fetch_and_process_articles(
         raise
 
 if __name__ == "__main__":
-    df_top = fetch_and_process_articles()
+    parser = argparse.ArgumentParser(description="Fetch and rank AI x Gaming articles.")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Score with realtime API calls instead of the (cheaper, slower) Batch API")
+    args = parser.parse_args()
+
+    df_top = fetch_and_process_articles(realtime=args.realtime)
     print(df_top)
 
 
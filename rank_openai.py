@@ -1,13 +1,26 @@
 import openai
+import asyncio
 import pandas as pd
 import time
-import math
-from typing import List, Optional, Dict
-from dataclasses import dataclass
-import re
+from typing import List, Optional, Dict, Tuple, Union, AsyncIterator
+from dataclasses import dataclass, field, replace
 import os
+import json
+import hashlib
+import heapq
+import re
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from collections import defaultdict
+import httpx
+import tiktoken
+import diskcache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletion
+from aiolimiter import AsyncLimiter
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type
 from config import check_environment_variables
 
 # Load environment variables
@@ -16,14 +29,76 @@ load_dotenv()
 # Check environment variables
 check_environment_variables()
 
+# API Configuration
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+MODEL_NAME = "gpt-4o-mini"
+DEFAULT_BATCH_SIZE = 50  # maximum number of articles per scoring request
+
+# Token budget configuration
+MAX_INPUT_TOKENS = 8000  # prompt tokens per scoring request
+SCORE_TOKENS_PER_ARTICLE = 8  # completion tokens for one compact {"i":n,"s":n} entry
+SCORE_TOKENS_OVERHEAD = 16  # completion slack per scoring request
+MAX_TRUNCATION_RETRIES = 3  # times the unscored tail of a cut-off reply is re-queued
+PROMPT_CACHE_MIN_TOKENS = 1024  # OpenAI only caches prompt prefixes at least this long
+
+# Score cache configuration
+SCORE_CACHE_DIR = ".score_cache"
+SCORE_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+# Pre-filter configuration: articles without any of these keywords skip the API.
+# The acronyms are matched inside words too, so "OpenAI", "GenAI" and "ChatGPT" count.
+RELEVANCE_KEYWORDS_RE = re.compile(
+    r'ai\b|gpt|openai|artificial intelligence|machine learning|deep learning|generative'
+    r'|\b(?:agents?|agentic|llms?|npcs?|gaming|games?|neural|models?|crypto)\b',
+    re.IGNORECASE
+)
+PREFILTER_SCORE = 1  # score given to articles rejected by the pre-filter
+
+# Top article configuration
+TOP_SCORE_THRESHOLD = 7  # articles must score above this to be top articles
+BULLET_POINTS_CONCURRENCY = 4  # maximum bullet points summaries generated at once
+BULLET_POINTS_SPECULATIVE_LIMIT = 3  # bullet points started early beyond the top N, at most
+
+# Rate limit configuration (published limits for MODEL_NAME on our usage tier)
+RPM_LIMIT = 500  # requests per minute
+TPM_LIMIT = 200_000  # tokens per minute
+RATE_LIMIT_HEADROOM = 0.95  # stay slightly below the limits to absorb bursts
+RATE_LIMIT_MIN_REMAINING = 2  # pause until the window resets below this many remaining requests
+MAX_CONCURRENCY = 16  # maximum in-flight requests
+
+# HTTP connection configuration of the async client
+MAX_CONNECTIONS = 128
+MAX_KEEPALIVE_CONNECTIONS = 64
+
+# Retry configuration (retries are handled by tenacity, not by the OpenAI client)
+API_TIMEOUT = 30.0  # seconds
+MAX_ATTEMPTS = 6
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError
+)
+
+# Batch API configuration
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30  # seconds
+
 # Initialize OpenAI client with API key from environment
 client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'),
-    base_url="https://api.openai.com/v1")
+    base_url=OPENAI_BASE_URL, timeout=API_TIMEOUT, max_retries=0)
 
-# API Configuration
-MODEL_NAME = "gpt-4o-mini"
-DEFAULT_BATCH_SIZE = 10
-RATE_LIMIT_DELAY = 1.2  # seconds
+# Exponential backoff with jitter on transient API errors
+api_retry = retry(
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    reraise=True
+)
+
+# Scores persisted across runs, keyed by score_cache_key
+score_cache = diskcache.Cache(SCORE_CACHE_DIR)
 
 # Prompt Configuration
 PROMPT_TEMPLATE = """
@@ -79,10 +154,29 @@ For each article summary, assign a **relevance score from 1 to 10**, based on th
 
 ---
 
+📚 Calibration Examples:
+
+- "A mobile studio ships a live game whose quests, dialogue and NPC behaviour are generated by an LLM at runtime, with retention numbers before and after" → **10** (AI applied to games, real data, strategic depth)
+- "A game engine adds an AI assistant that generates 3D assets and level blockouts from text prompts, with a hands-on demo" → **9** (AI tooling for game creation, shown working)
+- "A publisher says it will 'explore generative AI' across its portfolio, without details" → **5** (vague AI claims without details, rule 5)
+- "A research lab open-sources a framework that lets AI agents plan, use tools and coordinate with each other, with benchmarks" → **9** (strategic agent breakthrough, even outside gaming)
+- "A startup raises a seed round to build AI sales agents for e-commerce" → **6** (agent business news, no gaming angle)
+- "A crypto project launches autonomous AI agents that trade in-game items on a blockchain" → **7** (AI in Web3: relevant, capped and penalized)
+- "A cloud provider announces a new GPU instance family for LLM training" → **5** (generic AI infrastructure, limited insight)
+- "A chipmaker unveils an 'AI-ready' gaming laptop with mostly marketing claims" → **4** (vague AI claims, hardware marketing)
+- "A hospital network deploys an LLM to summarize patient records" → **5** (generic AI, no gaming or agents)
+- "A console maker reports quarterly sales and its holiday game lineup" → **2** (gaming without AI)
+- "An NFT marketplace changes its fee structure" → **1** (no AI relevance)
+- "An annual industry report measures AI adoption among game developers, with survey data on tools, budgets and concerns" → **9** (major strategic report on AI in gaming)
+- "An opinion column argues AI will replace game writers, without new facts" → **5** (opinion, limited original depth)
+
+Score each article on its own merits: the examples show how the rules combine, they are not a list of topics to match.
+
+---
+
 💬 Output Format:
-Article 1: 7  
-Article 2: 3  
-...
+Return compact JSON (no spaces or line breaks) with one entry per article, where "i" is the article number and "s" its score:
+{"scores":[{"i":1,"s":7},{"i":2,"s":3},...]}
 
 Ask yourself: *Would this make a strong LinkedIn post for someone leading a €200M AI Gaming fund, focusing on the future of AI in gaming and interactivity?*
 """
@@ -109,6 +203,44 @@ Article URL: {url}
 
 Write the post in a format ready to be copied and pasted to LinkedIn:"""
 
+# Cached scores are only valid for the model and rubric that produced them
+SCORE_CACHE_NAMESPACE = hashlib.blake2b(f"{MODEL_NAME}\n{PROMPT_TEMPLATE}".encode("utf-8"), digest_size=16).digest()
+
+# Matches the parts of a rate limit reset duration such as "6m0s" or "120ms"
+RESET_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+RESET_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+# Matches complete {"i":n,"s":n} entries, used to salvage a truncated scoring reply
+SCORE_ENTRY_RE = re.compile(r'\{\s*"i"\s*:\s*(\d+)\s*,\s*"s"\s*:\s*(\d+)\s*\}')
+
+# Structured output schema of scoring replies
+SCORES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "article_scores",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "scores": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "i": {"type": "integer"},
+                            "s": {"type": "integer", "minimum": 1, "maximum": 10}
+                        },
+                        "required": ["i", "s"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["scores"],
+            "additionalProperties": False
+        }
+    }
+}
+
 class OpenAIError(Exception):
     """Custom exception for OpenAI API errors."""
     pass
@@ -123,29 +255,393 @@ class ArticleBatch:
     total_batches: int
     prompt: str
 
-def format_prompt(df_batch: pd.DataFrame) -> str:
+@dataclass
+class RequestStats:
+    """Data class to accumulate statistics of one kind of request."""
+    requests: int = 0
+    errors: int = 0
+    latency: float = 0.0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+
+@dataclass
+class ApiMetrics:
+    """Per-tag request statistics and queue depth of a run."""
+    stats: Dict[str, RequestStats] = field(default_factory=lambda: defaultdict(RequestStats))
+    queued: int = 0
+    max_queued: int = 0
+
+    def observe(self, tag: str, latency: float, usage: Optional[CompletionUsage]) -> None:
+        """Record a successful request."""
+        stats = self.stats[tag]
+        stats.requests += 1
+        stats.latency += latency
+        if usage:
+            details = usage.prompt_tokens_details
+            stats.prompt_tokens += usage.prompt_tokens
+            stats.cached_tokens += (details.cached_tokens or 0) if details else 0
+            stats.completion_tokens += usage.completion_tokens
+
+    def report(self) -> None:
+        """Print a summary of the run's requests."""
+        for tag, stats in self.stats.items():
+            avg_latency = stats.latency / stats.requests if stats.requests else 0.0
+            tokens_per_second = stats.completion_tokens / stats.latency if stats.latency else 0.0
+            print(
+                f"📊 {tag}: {stats.requests} requests, {stats.errors} errors, "
+                f"{avg_latency:.2f}s avg, {tokens_per_second:.0f} tokens/s, "
+                f"{stats.cached_tokens}/{stats.prompt_tokens} cached prompt tokens"
+            )
+        if self.stats:
+            print(f"📊 Peak queue depth: {self.max_queued}")
+
+@dataclass
+class ApiSession:
+    """Async client, rate limiters and metrics shared by every request of a run."""
+    client: AsyncOpenAI
+    semaphore: asyncio.Semaphore
+    rpm_limiter: AsyncLimiter
+    tpm_limiter: AsyncLimiter
+    metrics: ApiMetrics = field(default_factory=ApiMetrics)
+    resume_at: float = 0.0  # event loop time before which no request is sent
+
+    async def __aenter__(self) -> "ApiSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.metrics.report()
+        await self.client.close()
+
+def get_article_texts(df: pd.DataFrame, column: str = 'Summary') -> List[str]:
+    """
+    Get the text sent to the model for each article: its summary, or its
+    title when the summary is empty.
+    
+    Args:
+        df (pd.DataFrame): Articles with a 'Title' column
+        column (str): Name of the column containing article content
+        
+    Returns:
+        List[str]: Text to score, one per row
+    """
+    # Vectorized over the whole column instead of stripping and testing row by row
+    summaries = df[column].fillna('').astype(str).str.strip()
+    titles = df['Title'].fillna('').astype(str).str.strip()
+    return summaries.mask(summaries.eq(''), titles).tolist()
+
+def score_cache_key(text: str) -> str:
+    """
+    Build the score cache key of an article.
+    
+    Args:
+        text (str): Article text sent to the model
+        
+    Returns:
+        str: Hash of the text, namespaced by model and scoring prompt
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16, salt=SCORE_CACHE_NAMESPACE).hexdigest()
+
+def format_article(index: int, text: str) -> str:
+    """
+    Format one article entry of the scoring prompt.
+    
+    Args:
+        index (int): 1-based position of the article in its batch
+        text (str): Article text
+        
+    Returns:
+        str: Article entry
+    """
+    return f"\n---\nArticle {index}:\n{text}\n"
+
+def format_prompt(texts: List[str]) -> str:
+    """
+    Format the article summaries of a batch for the OpenAI API.
+    
+    The scoring rules are sent separately as the system message (see
+    build_scoring_request) so that the prompt prefix is identical across
+    requests and can be served from OpenAI's prompt cache.
+    
+    Args:
+        texts (List[str]): Texts of the batch's articles, see get_article_texts
+        
+    Returns:
+        str: Formatted article summaries
+    """
+    # One join over all entries: the buffer is sized once instead of growing per article
+    return "".join([format_article(i, text) for i, text in enumerate(texts, 1)])
+
+def create_async_client() -> AsyncOpenAI:
+    """
+    Create an async OpenAI client.
+    
+    The client is bound to the event loop it is used on, so it must be created
+    inside the coroutine that uses it rather than at module level. It speaks
+    HTTP/2, so concurrent requests are multiplexed over a few pooled
+    connections instead of each opening its own TLS connection.
+    
+    Returns:
+        AsyncOpenAI: Async client configured from the environment
+    """
+    http_client = DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+    # Closing the OpenAI client also closes http_client
+    return AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'),
+        base_url=OPENAI_BASE_URL, http_client=http_client, timeout=API_TIMEOUT, max_retries=0)
+
+def create_api_session() -> ApiSession:
+    """
+    Create the client, concurrency cap and rate limiters for one run.
+    
+    Must be called from inside the event loop that will use the session.
+    
+    Returns:
+        ApiSession: Session to pass to every API call of the run
+    """
+    return ApiSession(
+        client=create_async_client(),
+        semaphore=asyncio.Semaphore(MAX_CONCURRENCY),
+        rpm_limiter=AsyncLimiter(max_rate=RPM_LIMIT * RATE_LIMIT_HEADROOM, time_period=60),
+        tpm_limiter=AsyncLimiter(max_rate=TPM_LIMIT * RATE_LIMIT_HEADROOM, time_period=60)
+    )
+
+@lru_cache(maxsize=None)
+def get_encoding() -> tiktoken.Encoding:
+    """
+    Get the tokenizer of MODEL_NAME, loading it on first use.
+    
+    Returns:
+        tiktoken.Encoding: Tokenizer used to size scoring requests
+    """
+    return tiktoken.encoding_for_model(MODEL_NAME)
+
+def count_tokens(text: str) -> int:
     """
-    Format the prompt for OpenAI API with article summaries.
+    Count the tokens of a text with the tokenizer of MODEL_NAME.
     
     Args:
-        df_batch (pd.DataFrame): Batch of articles to process
+        text (str): Text to count
         
     Returns:
-        str: Formatted prompt with article summaries
+        int: Token count
+    """
+    # Counts only size requests, so special-token strings in article text are counted as plain text
+    return len(get_encoding().encode(text, disallowed_special=()))
+
+@asynccontextmanager
+async def reserve_capacity(session: ApiSession, request: Dict) -> AsyncIterator[None]:
+    """
+    Hold a concurrency slot and reserve rate limit budget for one request.
+    
+    Args:
+        session (ApiSession): Async client and rate limiters
+        request (Dict): Keyword arguments for chat.completions.create
     """
-    prompt = PROMPT_TEMPLATE
+    # Reserve the prompt and completion budget before sending the request
+    prompt_tokens = sum(count_tokens(message["content"]) for message in request["messages"])
+    tokens = min(prompt_tokens + request["max_tokens"], session.tpm_limiter.max_rate)
 
-    for i, row in enumerate(df_batch.itertuples(), 1):
-        text = row.Summary.strip() if isinstance(row.Summary, str) and row.Summary.strip() else row.Title.strip()
-        prompt += f"\n---\nArticle {i}:\n{text}\n"
+    # Track how many requests are waiting for a free concurrency slot
+    metrics = session.metrics
+    waiting = session.semaphore.locked()
+    if waiting:
+        metrics.queued += 1
+        metrics.max_queued = max(metrics.max_queued, metrics.queued)
+    try:
+        await session.semaphore.acquire()
+    finally:
+        if waiting:
+            metrics.queued -= 1
+
+    try:
+        # Honour a pause requested by the rate limit headers of a previous response
+        delay = session.resume_at - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-    return prompt
+        async with session.rpm_limiter:
+            await session.tpm_limiter.acquire(tokens)
+            yield
+    finally:
+        session.semaphore.release()
 
-def process_batch(batch: ArticleBatch) -> List[Optional[int]]:
+def parse_reset_duration(value: str) -> float:
+    """
+    Parse a rate limit reset duration header such as "1s", "6m0s" or "120ms".
+    
+    Args:
+        value (str): Header value
+        
+    Returns:
+        float: Duration in seconds, 0 when the value cannot be parsed
+    """
+    return sum(float(amount) * RESET_DURATION_UNITS[unit] for amount, unit in RESET_DURATION_RE.findall(value))
+
+def update_rate_limit_pause(session: ApiSession, headers: httpx.Headers) -> None:
+    """
+    Pause the session until the request window resets when the rate limit
+    headers show it is almost exhausted.
+    
+    Args:
+        session (ApiSession): Async client and rate limiters
+        headers (httpx.Headers): Response headers
+    """
+    try:
+        remaining = int(headers.get('x-ratelimit-remaining-requests', ''))
+    except ValueError:
+        # Missing or unexpected header value, do not pause
+        return
+    if remaining >= RATE_LIMIT_MIN_REMAINING:
+        return
+
+    reset = parse_reset_duration(headers.get('x-ratelimit-reset-requests', ''))
+    session.resume_at = max(session.resume_at, asyncio.get_running_loop().time() + reset)
+
+@api_retry
+async def send_chat_request(session: ApiSession, tag: str, request: Dict) -> ChatCompletion:
+    """
+    Send one chat completion request, retrying transient errors.
+    
+    Args:
+        session (ApiSession): Async client and rate limiters
+        tag (str): Request kind, used to group metrics
+        request (Dict): Keyword arguments for chat.completions.create
+        
+    Returns:
+        ChatCompletion: API response
+    """
+    async with reserve_capacity(session, request):
+        start = time.perf_counter()
+        try:
+            raw_response = await session.client.chat.completions.with_raw_response.create(**request)
+        except Exception:
+            session.metrics.stats[tag].errors += 1
+            raise
+        response = raw_response.parse()
+        session.metrics.observe(tag, time.perf_counter() - start, response.usage)
+        update_rate_limit_pause(session, raw_response.headers)
+        return response
+
+async def create_chat_completion(
+    session: ApiSession,
+    messages: List[Dict[str, str]],
+    *,
+    max_tokens: int,
+    model: str = MODEL_NAME,
+    temperature: float = 0,
+    n: int = 1,
+    response_format: Optional[Dict] = None,
+    tag: str = "chat"
+) -> ChatCompletion:
+    """
+    Send a chat completion request within the session's concurrency cap and
+    rate limits, retrying transient errors and recording metrics.
+    
+    Every API call of the module goes through this helper.
+    
+    Args:
+        session (ApiSession): Async client and rate limiters
+        messages (List[Dict[str, str]]): Chat messages
+        max_tokens (int): Completion token budget
+        model (str): Model name
+        temperature (float): Sampling temperature
+        n (int): Number of choices to generate
+        response_format (Optional[Dict]): Structured output format, if any
+        tag (str): Request kind, used to group metrics
+        
+    Returns:
+        ChatCompletion: API response
+    """
+    request = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "n": n,
+        "max_tokens": max_tokens
+    }
+    if response_format is not None:
+        request["response_format"] = response_format
+
+    return await send_chat_request(session, tag, request)
+
+def build_scoring_request(batch: ArticleBatch) -> Dict:
+    """
+    Build the chat completion parameters used to score a batch.
+    
+    Shared by the realtime and Batch API paths so both send identical requests.
+    
+    Args:
+        batch (ArticleBatch): Batch of articles to score
+        
+    Returns:
+        Dict: Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": MODEL_NAME,
+        # The static scoring rules come first so their tokens can be cached server-side
+        "messages": [
+            {"role": "system", "content": PROMPT_TEMPLATE},
+            {"role": "user", "content": batch.prompt}
+        ],
+        "temperature": 0,
+        "n": 1,
+        "response_format": SCORES_RESPONSE_FORMAT,
+        # Exact-fit completion budget: one compact entry per article plus the JSON wrapper
+        "max_tokens": len(batch.summaries) * SCORE_TOKENS_PER_ARTICLE + SCORE_TOKENS_OVERHEAD
+    }
+
+def parse_scores(reply: Optional[str], n_articles: int, refusal: Optional[str] = None) -> List[Optional[int]]:
+    """
+    Parse a structured scoring reply.
+    
+    A refused, empty or malformed reply leaves the whole batch unscored
+    instead of failing, so the other batches of the run keep their scores.
+    
+    Args:
+        reply (Optional[str]): Model reply following SCORES_RESPONSE_FORMAT,
+            None when the model refused
+        n_articles (int): Number of articles in the scored batch
+        refusal (Optional[str]): Refusal message of the reply, if any
+        
+    Returns:
+        List[Optional[int]]: Score per article, None when missing or invalid
+    """
+    scores = [None] * n_articles
+
+    if reply is None:
+        print(f"⚠️ Scoring reply has no content, batch left unscored: {refusal or 'no refusal message'}")
+        return scores
+
+    try:
+        items = [(item.get("i", 0), item.get("s")) for item in json.loads(reply).get("scores", [])]
+    except json.JSONDecodeError:
+        # The completion budget is tight, so a reply cut off at max_tokens keeps its complete entries
+        items = [(int(i), int(s)) for i, s in SCORE_ENTRY_RE.findall(reply)]
+    except (TypeError, AttributeError, ValueError):
+        print(f"⚠️ Malformed scoring reply, batch left unscored: {reply[:100]}")
+        return scores
+
+    for i, score in items:
+        if not isinstance(i, int) or not isinstance(score, int):
+            continue
+        idx = i - 1
+        if 0 <= idx < n_articles and 1 <= score <= 10:  # Only accept valid scores
+            scores[idx] = score
+
+    return scores
+
+async def process_batch_async(session: ApiSession, batch: ArticleBatch) -> List[Optional[int]]:
     """
     Process a batch of articles through the OpenAI API.
     
     Args:
+        session (ApiSession): Async client and rate limiters
         batch (ArticleBatch): Batch of articles to process
         
     Returns:
@@ -155,40 +651,40 @@ def process_batch(batch: ArticleBatch) -> List[Optional[int]]:
         OpenAIError: If the API request fails
     """
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": batch.prompt}],
-            temperature=0,
-            max_tokens=500
-        )
-        
         scores = [None] * len(batch.summaries)
-        reply = response.choices[0].message.content
-
-        for line in reply.strip().split('\n'):
-            if ':' in line:
-                try:
-                    idx, score = line.split(':')
-                    idx = int(idx.strip().replace("Article", "")) - 1
-                    # Try to extract the first number from the score part
-                    numbers = re.findall(r'\d+', score.strip())
-                    if numbers:
-                        score = int(numbers[0])
-                        if 1 <= score <= 10:  # Only accept valid scores
-                            scores[idx] = score
-                except (ValueError, IndexError):
-                    continue
+        pending = list(range(len(batch.summaries)))
+        request_batch = batch
+
+        for attempt in range(MAX_TRUNCATION_RETRIES + 1):
+            response = await create_chat_completion(session, **build_scoring_request(request_batch), tag="scoring")
+
+            choice = response.choices[0]
+            request_scores = parse_scores(choice.message.content, len(pending), choice.message.refusal)
+            for idx, score in zip(pending, request_scores):
+                scores[idx] = score
+            pending = [idx for idx, score in zip(pending, request_scores) if score is None]
+            if choice.finish_reason != "length" or not pending:
+                break
+
+            # The exact-fit budget ran out, score the unscored tail in a smaller request
+            print(f"⚠️ Batch {batch.batch_number}/{batch.total_batches} reply cut off at max_tokens, "
+                  f"{len(pending)} articles unscored")
+            if attempt < MAX_TRUNCATION_RETRIES:
+                texts = [batch.summaries[idx] for idx in pending]
+                request_batch = replace(batch, summaries=texts, prompt=format_prompt(texts))
 
+        print(f"🔍 Processed batch {batch.batch_number}/{batch.total_batches}")
         return scores
 
     except Exception as e:
         raise OpenAIError(f"Failed to process batch {batch.batch_number}: {str(e)}")
 
-def generate_bullet_points_summary(title: str, content: str) -> str:
+async def generate_bullet_points_summary_async(session: ApiSession, title: str, content: str) -> str:
     """
     Generate a bullet points summary of the article in the specified format.
     
     Args:
+        session (ApiSession): Async client and rate limiters
         title (str): The article title
         content (str): The article content
         
@@ -196,7 +692,8 @@ def generate_bullet_points_summary(title: str, content: str) -> str:
         str: Formatted bullet points summary
     """
     try:
-        response = client.chat.completions.create(
+        response = await create_chat_completion(
+            session,
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": """You are an expert at analyzing gaming and AI news articles.
@@ -220,7 +717,8 @@ def generate_bullet_points_summary(title: str, content: str) -> str:
                 {"role": "user", "content": f"Title: {title}\n\nContent: {content}"}
             ],
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=1000,
+            tag="bullet_points"
         )
         
         return response.choices[0].message.content.strip()
@@ -229,64 +727,335 @@ def generate_bullet_points_summary(title: str, content: str) -> str:
         print(f"Error generating bullet points summary: {str(e)}")
         return "Error generating summary"
 
-def batch_gpt_scoring(df: pd.DataFrame, column: str, batch_size: int = 15) -> pd.DataFrame:
+def build_article_batches(texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[ArticleBatch]:
+    """
+    Split the articles into scoring batches.
+    
+    Articles are packed greedily: a batch is closed once adding the next
+    article would exceed MAX_INPUT_TOKENS, so each request carries as many
+    articles as the token budget allows and the prompt overhead is amortized.
+    
+    Args:
+        texts (List[str]): Texts of the articles to score, see get_article_texts
+        batch_size (int): Maximum number of articles in each batch
+        
+    Returns:
+        List[ArticleBatch]: Batches covering every article
+    """
+    prompt_tokens = count_tokens(PROMPT_TEMPLATE)
+    if prompt_tokens < PROMPT_CACHE_MIN_TOKENS:
+        print(f"⚠️ Scoring prompt is {prompt_tokens} tokens, too short for prompt caching ({PROMPT_CACHE_MIN_TOKENS})")
+    ranges = []
+    start_idx = 0
+    cur_tokens = prompt_tokens
+
+    for i, text in enumerate(texts):
+        # The article number only shifts the count by a token, so count it once as "Article 1"
+        tokens = count_tokens(format_article(1, text))
+        # Flush the current batch when this article does not fit, but never emit an empty batch
+        if i > start_idx and (cur_tokens + tokens > MAX_INPUT_TOKENS or i - start_idx >= batch_size):
+            ranges.append((start_idx, i))
+            start_idx = i
+            cur_tokens = prompt_tokens
+        cur_tokens += tokens
+
+    if start_idx < len(texts):
+        ranges.append((start_idx, len(texts)))
+
+    batches = []
+    for b, (start_idx, end_idx) in enumerate(ranges):
+        batch_texts = texts[start_idx:end_idx]
+
+        batches.append(ArticleBatch(
+            summaries=batch_texts,
+            start_index=start_idx,
+            end_index=end_idx,
+            batch_number=b + 1,
+            total_batches=len(ranges),
+            prompt=format_prompt(batch_texts)
+        ))
+
+    return batches
+
+def merge_batch_scores(
+    batches: List[ArticleBatch],
+    results: List[List[Optional[int]]],
+    n_articles: int
+) -> List[Optional[int]]:
+    """
+    Write per-batch scores back to their position in the article list.
+    
+    Args:
+        batches (List[ArticleBatch]): Scored batches
+        results (List[List[Optional[int]]]): Scores of each batch, in the same order
+        n_articles (int): Total number of articles
+        
+    Returns:
+        List[Optional[int]]: Score per article
+    """
+    scores = [None] * n_articles
+
+    for batch, batch_scores in zip(batches, results):
+        for idx, score in enumerate(batch_scores):
+            if score is not None:
+                scores[batch.start_index + idx] = score
+
+    return scores
+
+async def iter_scored_batches(
+    session: ApiSession,
+    texts: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[Tuple[ArticleBatch, List[Optional[int]]]]:
+    """
+    Score articles with GPT, sending all batches concurrently and yielding
+    each batch as soon as its scores arrive.
+    
+    Args:
+        session (ApiSession): Async client and rate limiters
+        texts (List[str]): Texts of the articles to score, see get_article_texts
+        batch_size (int): Maximum number of articles in each batch
+        
+    Yields:
+        Tuple[ArticleBatch, List[Optional[int]]]: Batch and its scores, in completion order
+    """
+    async def score(batch: ArticleBatch) -> Tuple[ArticleBatch, List[Optional[int]]]:
+        return batch, await process_batch_async(session, batch)
+
+    # Build every batch up front so they can be dispatched together
+    batches = build_article_batches(texts, batch_size)
+
+    print(f"🤖 Starting article scoring ({len(batches)} batches)...")
+    tasks = [asyncio.create_task(score(batch)) for batch in batches]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop the remaining batches if a batch failed or the consumer stopped early
+        for task in tasks:
+            task.cancel()
+
+def submit_scoring_batch(texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Optional[int]]:
+    """
+    Score articles through the OpenAI Batch API and wait for the results.
+    
+    Batch requests cost half as much and do not count against the synchronous
+    rate limits, at the price of a completion window of up to 24 hours.
+    
+    Args:
+        texts (List[str]): Texts of the articles to score, see get_article_texts
+        batch_size (int): Maximum number of articles in each batch
+        
+    Returns:
+        List[Optional[int]]: Score per article
+        
+    Raises:
+        OpenAIError: If the batch job fails or does not complete
+    """
+    batches = build_article_batches(texts, batch_size)
+    if not batches:
+        return []
+
+    # One JSONL line per article batch, keyed by batch number
+    lines = [
+        json.dumps({
+            "custom_id": f"batch-{batch.batch_number}",
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": build_scoring_request(batch)
+        })
+        for batch in batches
+    ]
+    payload = "\n".join(lines).encode("utf-8")
+
+    try:
+        input_file = api_retry(client.files.create)(file=("scoring_batch.jsonl", payload), purpose="batch")
+        job = api_retry(client.batches.create)(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        print(f"📦 Submitted scoring batch {job.id} ({len(batches)} requests)")
+
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_INTERVAL)
+            job = api_retry(client.batches.retrieve)(job.id)
+            print(f"⏳ Scoring batch {job.id}: {job.status}")
+
+        if job.status != "completed" or not job.output_file_id:
+            raise OpenAIError(f"Scoring batch {job.id} ended with status {job.status}")
+
+        output = api_retry(client.files.content)(job.output_file_id).text
+
+    except OpenAIError:
+        raise
+    except Exception as e:
+        raise OpenAIError(f"Failed to run scoring batch: {str(e)}")
+
+    # Results come back in arbitrary order, match them by custom_id
+    results_by_id = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                print(f"Error in scoring request {result.get('custom_id')}: {result.get('error')}")
+                continue
+            results_by_id[result["custom_id"]] = response["body"]["choices"][0]
+        except (ValueError, TypeError, AttributeError, KeyError, IndexError) as e:
+            # Skip the broken line so the other batches of the paid job keep their scores
+            print(f"Error in scoring batch output line {line[:100]}: {str(e)}")
+
+    results = []
+    for batch in batches:
+        choice = results_by_id.get(f"batch-{batch.batch_number}", {"message": {"content": ""}})
+        message = choice.get("message") or {}
+        batch_scores = parse_scores(message.get("content"), len(batch.summaries), message.get("refusal"))
+        if choice.get("finish_reason") == "length":
+            # Unscored articles are not cached, so the next run scores them again
+            print(f"⚠️ Batch {batch.batch_number}/{batch.total_batches} reply cut off at max_tokens, "
+                  f"{batch_scores.count(None)} articles unscored")
+        results.append(batch_scores)
+    return merge_batch_scores(batches, results, len(texts))
+
+def is_relevant_text(text: str) -> bool:
+    """
+    Check whether an article text mentions any AI or gaming keyword.
+    
+    Args:
+        text (str): Article title and summary
+        
+    Returns:
+        bool: True when the article should be scored by the API
+        
+    Examples:
+        >>> is_relevant_text("OpenAI unveils a new reasoning model")
+        True
+        >>> is_relevant_text("ChatGPT now powers NPC dialogue in a hit RPG")
+        True
+        >>> is_relevant_text("Artificial intelligence is reshaping how studios build levels")
+        True
+        >>> is_relevant_text("Nvidia ACE brings generative characters to RPGs")
+        True
+        >>> is_relevant_text("Machine learning startup raises $20M")
+        True
+        >>> is_relevant_text("GenAI tools for artists")
+        True
+        >>> is_relevant_text("Central bank raises interest rates")
+        False
+    """
+    return RELEVANCE_KEYWORDS_RE.search(text) is not None
+
+def lookup_scores(texts: List[str], titles: List[str]) -> Tuple[List[Optional[int]], List[str]]:
+    """
+    Score what can be scored without the API: articles rejected by the
+    keyword pre-filter and articles found in the score cache.
+    
+    Args:
+        texts (List[str]): Texts of the articles to score, see get_article_texts
+        titles (List[str]): Titles of the articles, also checked by the pre-filter
+        
+    Returns:
+        Tuple[List[Optional[int]], List[str]]: Score per article (None when it
+            still needs the API) and score cache key per article
+    """
+    # Articles without any AI or gaming keyword in their title or text cannot score well, skip the API for them
+    relevant = [is_relevant_text(f"{title} {text}") for title, text in zip(titles, texts)]
+    scores = [None if is_relevant else PREFILTER_SCORE for is_relevant in relevant]
+    print(f"🧹 {relevant.count(False)}/{len(texts)} articles filtered out by keywords")
+
+    # Reuse scores from previous runs and only send unseen articles to the API
+    keys = [score_cache_key(text) for text in texts]
+    for i, is_relevant in enumerate(relevant):
+        if is_relevant:
+            scores[i] = score_cache.get(keys[i])
+    n_misses = scores.count(None)
+    print(f"💾 {relevant.count(True) - n_misses}/{relevant.count(True)} scores found in cache")
+
+    return scores, keys
+
+def batch_gpt_scoring(df: pd.DataFrame, column: str, batch_size: int = DEFAULT_BATCH_SIZE, realtime: bool = True) -> pd.DataFrame:
     """
     Process a batch of articles with GPT scoring.
     
     Args:
         df (pd.DataFrame): DataFrame containing articles
         column (str): Name of the column containing article content
-        batch_size (int): Number of articles to process in each batch
+        batch_size (int): Maximum number of articles in each batch
+        realtime (bool): Score through concurrent chat completions; when False,
+            use the cheaper but slower Batch API
         
     Returns:
-        pd.DataFrame: DataFrame with added GPT scores
+        pd.DataFrame: DataFrame with added GPT scores, in its original order;
+            articles left unscored by a failure get NaN
     """
+    scores = [None] * len(df)
+
     try:
-        # Calculate number of batches
-        n_batches = math.ceil(len(df) / batch_size)
-        scores = [None] * len(df)
-        
-        # Score all articles in batches
-        print("🤖 Starting article scoring...")
-        for b in range(n_batches):
-            start_idx = b * batch_size
-            end_idx = min((b + 1) * batch_size, len(df))
-            df_batch = df.iloc[start_idx:end_idx]
-            
-            # Create batch for scoring
-            article_batch = ArticleBatch(
-                summaries=df_batch[column].tolist(),
-                start_index=start_idx,
-                end_index=end_idx,
-                batch_number=b + 1,
-                total_batches=n_batches,
-                prompt=format_prompt(df_batch)
-            )
-            
-            print(f"🔍 Processing batch {b + 1}/{n_batches}")
-            
-            # Get GPT scoring for the batch
-            batch_scores = process_batch(article_batch)
-            
-            # Update scores in the list
-            for idx, score in enumerate(batch_scores):
+        # Extract the texts once; everything below works on plain lists
+        texts = get_article_texts(df, column)
+        scores, keys = lookup_scores(texts, df['Title'].tolist())
+        misses = [i for i, score in enumerate(scores) if score is None]
+
+        def record(positions: List[int], new_scores: List[Optional[int]]) -> None:
+            for i, score in zip(positions, new_scores):
                 if score is not None:
-                    scores[start_idx + idx] = score
-            
-            # Add a small delay between batches to respect rate limits
-            if b < n_batches - 1:
-                time.sleep(RATE_LIMIT_DELAY)
-        
-        # Update DataFrame with all scores
-        df['GPT_Pertinence'] = scores
-        df = df.sort_values('GPT_Pertinence', ascending=False)
-        #df['Summary'] = df[column].apply(lambda x: x[:300] + '...' if isinstance(x, str) else '')
-        
-        return df
+                    scores[i] = score
+                    score_cache.set(keys[i], score, expire=SCORE_CACHE_TTL)
+
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            if realtime:
+                async def run() -> None:
+                    async with create_api_session() as session:
+                        async for batch, batch_scores in iter_scored_batches(session, miss_texts, batch_size):
+                            # Cache each batch as it arrives so a later failure does not lose it
+                            record(misses[batch.start_index:batch.end_index], batch_scores)
+
+                asyncio.run(run())
+            else:
+                record(misses, submit_scoring_batch(miss_texts, batch_size))
         
     except Exception as e:
         print(f"❌ Error in batch_gpt_scoring: {str(e)}")
-        return df
+
+    finally:
+        # Update DataFrame with all scores, even partial ones (ranking is left to the caller)
+        df['GPT_Pertinence'] = pd.to_numeric(pd.Series(scores, index=df.index, dtype=object))
+        #df['Summary'] = df[column].apply(lambda x: x[:300] + '...' if isinstance(x, str) else '')
+
+    return df
+
+async def generate_bullet_points_async(articles: List[Tuple[str, str]]) -> List[Union[str, BaseException]]:
+    """
+    Generate bullet points summaries for several articles concurrently.
+    
+    Args:
+        articles (List[Tuple[str, str]]): (title, content) of each article
+        
+    Returns:
+        List[Union[str, BaseException]]: Summary, or the raised exception, per article
+    """
+    async with create_api_session() as session:
+        tasks = [generate_bullet_points_summary_async(session, title, content) for title, content in articles]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+def select_top_articles(df: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    """
+    Select the top N articles scoring above TOP_SCORE_THRESHOLD.
+    
+    Ties keep DataFrame order, like a stable descending sort.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing articles with GPT scores
+        top_n (int): Number of top articles to select
+        
+    Returns:
+        pd.DataFrame: Top articles, best first
+    """
+    return df.loc[df['GPT_Pertinence'] > TOP_SCORE_THRESHOLD].nlargest(top_n, 'GPT_Pertinence')
 
 def generate_bullet_points_for_top_articles(df: pd.DataFrame, column: str, top_n: int = 5) -> pd.DataFrame:
     """
@@ -302,23 +1071,27 @@ def generate_bullet_points_for_top_articles(df: pd.DataFrame, column: str, top_n
     """
     try:
         # Get top N articles
-        top_articles = df[df['GPT_Pertinence'] > 7].head(5)
+        top_articles = select_top_articles(df, top_n)
         
         print(f"📝 Generating bullet points for top {top_n} articles...")
         
-        # Generate bullet points for each top article
-        for idx, row in top_articles.iterrows():
-            try:
-                title = row.get('Title', '')
-                content = row[column]
-                if not content:
-                    content = row["Summary"]
-                bullet_points = generate_bullet_points_summary(title, content)
-                df.at[idx, 'Bullet_Points'] = bullet_points
-                print(f"✅ Generated bullet points for article: {title[:50]}...")
-            except Exception as e:
-                print(f"Error generating bullet points for article {idx}: {str(e)}")
+        articles = []
+        for title, content, summary in zip(
+            top_articles['Title'].tolist(),
+            top_articles[column].tolist(),
+            top_articles['Summary'].tolist()
+        ):
+            articles.append((title, content or summary))
+
+        # Generate bullet points for all top articles at once
+        results = asyncio.run(generate_bullet_points_async(articles))
+
+        for idx, (title, _), bullet_points in zip(top_articles.index, articles, results):
+            if isinstance(bullet_points, BaseException):
+                print(f"Error generating bullet points for article {idx}: {str(bullet_points)}")
                 continue
+            df.at[idx, 'Bullet_Points'] = bullet_points
+            print(f"✅ Generated bullet points for article: {title[:50]}...")
                 
         return df
         
@@ -326,11 +1099,165 @@ def generate_bullet_points_for_top_articles(df: pd.DataFrame, column: str, top_n
         print(f"❌ Error in generate_bullet_points_for_top_articles: {str(e)}")
         return df
 
-def generate_linkedin_post(article: Dict) -> str:
+async def score_and_summarize_async(
+    df: pd.DataFrame,
+    column: str,
+    content_column: str,
+    top_n: int = 5,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> pd.DataFrame:
+    """
+    Score articles and generate bullet points for the top N, overlapping the
+    two phases.
+    
+    Scored batches feed a queue; bullet points generation starts for an
+    article as soon as it scores above TOP_SCORE_THRESHOLD and ranks within
+    the top N of the articles scored so far. An article pushed out of that
+    top N can never come back, so its summary is cancelled. At most
+    top_n + BULLET_POINTS_SPECULATIVE_LIMIT summaries are started early.
+    Once scoring is complete, the final top articles not started yet are
+    summarized, and only the final top articles get bullet points.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing articles
+        column (str): Name of the column containing the text to score
+        content_column (str): Name of the column containing article content
+        top_n (int): Number of top articles to summarize
+        batch_size (int): Maximum number of articles in each scoring batch
+        
+    Returns:
+        pd.DataFrame: DataFrame with added GPT scores and bullet points
+    """
+    texts = get_article_texts(df, column)
+    scores, keys = lookup_scores(texts, df['Title'].tolist())
+    misses = [i for i, score in enumerate(scores) if score is None]
+
+    titles = df['Title'].tolist()
+    contents = [content or summary for content, summary in zip(df[content_column].tolist(), df['Summary'].tolist())]
+
+    queue: asyncio.Queue = asyncio.Queue()
+    bullet_tasks: Dict[int, asyncio.Task] = {}
+    started = 0
+    bullet_semaphore = asyncio.Semaphore(BULLET_POINTS_CONCURRENCY)
+
+    def rank(pos: int) -> Tuple[int, int]:
+        # Best score first, then DataFrame order, as in select_top_articles
+        return -scores[pos], pos
+
+    async with create_api_session() as session:
+        async def summarize(pos: int) -> str:
+            async with bullet_semaphore:
+                return await generate_bullet_points_summary_async(session, titles[pos], contents[pos])
+
+        async def scorer() -> None:
+            try:
+                # Articles scored by the pre-filter or the cache qualify right away, best first
+                known = [pos for pos, score in enumerate(scores) if score is not None and score > TOP_SCORE_THRESHOLD]
+                for pos in sorted(known, key=rank):
+                    await queue.put(pos)
+
+                async for batch, batch_scores in iter_scored_batches(session, [texts[i] for i in misses], batch_size):
+                    for offset, score in enumerate(batch_scores):
+                        if score is None:
+                            continue
+                        pos = misses[batch.start_index + offset]
+                        scores[pos] = score
+                        score_cache.set(keys[pos], score, expire=SCORE_CACHE_TTL)
+                        if score > TOP_SCORE_THRESHOLD:
+                            await queue.put(pos)
+            finally:
+                await queue.put(None)
+
+        async def bulleter() -> None:
+            nonlocal started
+            qualifying = []
+            while (pos := await queue.get()) is not None:
+                qualifying.append(pos)
+                current_top = heapq.nsmallest(top_n, qualifying, key=rank)
+
+                # Articles pushed out of the current top N cannot make the final top N
+                for dropped in [p for p in bullet_tasks if p not in current_top]:
+                    bullet_tasks.pop(dropped).cancel()
+
+                # Start early only while the article is in the current top N and within the waste cap
+                if pos in current_top and started < top_n + BULLET_POINTS_SPECULATIVE_LIMIT:
+                    bullet_tasks[pos] = asyncio.create_task(summarize(pos))
+                    started += 1
+
+        try:
+            try:
+                await asyncio.gather(scorer(), bulleter())
+            finally:
+                # Keep the scores of completed batches even if another batch failed
+                df['GPT_Pertinence'] = pd.to_numeric(pd.Series(scores, index=df.index, dtype=object))
+
+            # Scoring is complete, summarize the final top articles not started yet
+            top_positions = select_top_articles(df.reset_index(drop=True), top_n).index.tolist()
+            for pos in top_positions:
+                if pos not in bullet_tasks:
+                    bullet_tasks[pos] = asyncio.create_task(summarize(pos))
+                    started += 1
+
+            for pos in [p for p in bullet_tasks if p not in top_positions]:
+                bullet_tasks.pop(pos).cancel()
+
+            print(f"📝 Generating bullet points for {len(top_positions)} articles "
+                  f"({started - len(top_positions)} early summaries cancelled)...")
+            results = await asyncio.gather(*[bullet_tasks[pos] for pos in top_positions], return_exceptions=True)
+
+        except BaseException:
+            for task in bullet_tasks.values():
+                task.cancel()
+            raise
+
+    bullet_points = {}
+    for pos, result in zip(top_positions, results):
+        if isinstance(result, BaseException):
+            print(f"Error generating bullet points for article {df.index[pos]}: {str(result)}")
+            continue
+        bullet_points[pos] = result
+        print(f"✅ Generated bullet points for article: {titles[pos][:50]}...")
+    df['Bullet_Points'] = [bullet_points.get(pos) for pos in range(len(df))]
+
+    return df
+
+def score_and_summarize_articles(
+    df: pd.DataFrame,
+    column: str,
+    content_column: str,
+    top_n: int = 5,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> pd.DataFrame:
+    """
+    Score articles and generate bullet points for the top N in one pipeline.
+    
+    Synchronous wrapper around score_and_summarize_async, equivalent to
+    batch_gpt_scoring followed by generate_bullet_points_for_top_articles
+    but without waiting for every score before summarizing.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing articles
+        column (str): Name of the column containing the text to score
+        content_column (str): Name of the column containing article content
+        top_n (int): Number of top articles to summarize
+        batch_size (int): Maximum number of articles in each scoring batch
+        
+    Returns:
+        pd.DataFrame: DataFrame with added GPT scores and bullet points
+    """
+    try:
+        return asyncio.run(score_and_summarize_async(df, column, content_column, top_n, batch_size))
+        
+    except Exception as e:
+        print(f"❌ Error in score_and_summarize_articles: {str(e)}")
+        return df
+
+async def generate_linkedin_post_async(session: ApiSession, article: Dict) -> str:
     """
     Generate a LinkedIn post for an article using GPT.
     
     Args:
+        session (ApiSession): Async client and rate limiters
         article (Dict): Article data including title, summary, keywords, and URL
         
     Returns:
@@ -347,14 +1274,36 @@ def generate_linkedin_post(article: Dict) -> str:
             url=article['URL']
         )
 
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": prompt}],
+        response = await create_chat_completion(
+            session,
+            [{"role": "user", "content": prompt}],
             temperature=0.7,  # Slightly higher temperature for more creative writing
-            max_tokens=800
+            max_tokens=800,
+            tag="linkedin_post"
         )
         
         return response.choices[0].message.content.strip()
 
     except Exception as e:
-        raise OpenAIError(f"Failed to generate LinkedIn post: {str(e)}")
\ No newline at end of file
+        raise OpenAIError(f"Failed to generate LinkedIn post: {str(e)}")
+
+def generate_linkedin_post(article: Dict) -> str:
+    """
+    Generate a LinkedIn post for an article using GPT.
+    
+    Synchronous wrapper around generate_linkedin_post_async.
+    
+    Args:
+        article (Dict): Article data including title, summary, keywords, and URL
+        
+    Returns:
+        str: Generated LinkedIn post
+        
+    Raises:
+        OpenAIError: If the API request fails
+    """
+    async def run() -> str:
+        async with create_api_session() as session:
+            return await generate_linkedin_post_async(session, article)
+
+    return asyncio.run(run())